@@ -2,6 +2,7 @@
 Configuration settings for stock analysis project.
 """
 
+import logging
 import os
 from pathlib import Path
 
@@ -21,9 +22,20 @@ EXPORT_DIR = DATA_DIR / 'exports'
 # Log directory
 LOG_DIR = PROJECT_ROOT / 'logs'
 
-# Create directories if they don't exist
-for directory in [DAILY_DIR, HOURLY_DIR, METADATA_DIR, EXPORT_DIR, LOG_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+
+def ensure_dirs(*directories: Path) -> None:
+    """
+    Create directories that don't exist yet.
+
+    Called by code paths that write to disk rather than at import time.
+
+    Args:
+        directories: Directories to create (default: all data and log directories)
+    """
+    for directory in directories or (DAILY_DIR, HOURLY_DIR, METADATA_DIR, EXPORT_DIR, LOG_DIR):
+        if not directory.exists():
+            directory.mkdir(parents=True, exist_ok=True)
+
 
 # Date settings
 DEFAULT_START_DATE = '2000-01-01'  # Maximum available
@@ -41,6 +53,27 @@ DEFAULT_PERIOD = '730d'  # ~2 years for hourly data
 MAX_RETRIES = 3  # Number of retry attempts for failed downloads
 RETRY_DELAY = 5  # Seconds to wait between retries
 TIMEOUT = 30  # Request timeout in seconds
+MAX_WORKERS = 8  # Maximum concurrent per-symbol downloads
+ASYNC_CONCURRENCY = 8  # Maximum in-flight chart API requests for async downloads
+YAHOO_CHART_URL = 'https://query2.finance.yahoo.com/v8/finance/chart/{symbol}'
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+
+# Response cache
+CACHE_ENABLED = True  # Reuse recent yfinance responses from disk
+CACHE_DB = METADATA_DIR / 'yf_cache.sqlite'
+CACHE_TTL_DAILY = 24 * 3600  # Seconds before cached daily data expires
+CACHE_TTL_INTRADAY = 12 * 3600  # Seconds before cached intraday data expires
+INFO_CACHE_SECONDS = 300  # Seconds to reuse get_info/get_latest_price results
+HTTP_POOL_SIZE = 16  # Keep-alive connections kept per host
+
+# Parquet storage
+PARQUET_COMPRESSION = 'zstd'
+PARQUET_COMPRESSION_LEVEL = 3  # About half the size of snappy with similar decode speed
+PARQUET_ROW_GROUP_SIZE = 50_000  # Rows per row group; min/max stats per group drive filtered reads
+# Dtype for stored price columns; 'float32' halves the size but keeps only ~7 significant digits
+PRICE_DTYPE = 'float64'
+# Memory-map Parquet files on read; set STOCK_PARQUET_MMAP=0 when data lives on a network filesystem
+PARQUET_MEMORY_MAP = os.environ.get('STOCK_PARQUET_MMAP', '1') != '0'
 
 # Data validation
 MIN_PRICE = 0.01  # Minimum valid stock price
@@ -48,5 +81,7 @@ MAX_PRICE_CHANGE_PCT = 50  # Maximum daily price change % (to detect errors)
 
 # Logging
 LOG_LEVEL = 'INFO'  # DEBUG, INFO, WARNING, ERROR, CRITICAL
+LOG_LEVEL_NUM = getattr(logging, LOG_LEVEL)  # Resolved once for logging.basicConfig
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+LOG_BUFFER_SIZE = 65536  # Bytes buffered before log files are written
@@ -0,0 +1,151 @@
+"""
+Minimal command-line parser shared by the download/update scripts.
+
+The scripts only take a handful of flat options, so a small dict-driven
+parser is used instead of argparse to keep startup cheap.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Marker default for options that must be given on the command line
+REQUIRED = object()
+
+
+def _dest(option: str) -> str:
+    """Convert '--no-merge' to 'no_merge'."""
+    return option.lstrip('-').replace('-', '_')
+
+
+def _metavar(option: str, kind: str) -> str:
+    """Placeholder shown after an option in usage/help text."""
+    name = _dest(option).upper()
+    if kind == 'list':
+        return f" {name} [{name} ...]"
+    if kind == 'str':
+        return f" {name}"
+    return ""
+
+
+def format_usage(spec: dict) -> str:
+    """
+    Build the one-line usage string.
+
+    Args:
+        spec: Option spec (see parse)
+
+    Returns:
+        Usage string
+    """
+    parts = []
+    for option, (kind, default, *_) in spec.items():
+        part = option + _metavar(option, kind)
+        parts.append(part if default is REQUIRED else f"[{part}]")
+    return f"usage: {Path(sys.argv[0]).name} [-h] {' '.join(parts)}"
+
+
+def format_help(spec: dict, description: str = '', epilog: str = '') -> str:
+    """
+    Build the --help text from the option spec.
+
+    Args:
+        spec: Option spec (see parse)
+        description: Text shown below the usage line
+        epilog: Text shown after the option list
+
+    Returns:
+        Help text
+    """
+    rows = [('-h, --help', 'show this help message and exit')]
+    for option, (kind, default, help_text, *choices) in spec.items():
+        if choices:
+            help_text = f"{help_text} (choices: {', '.join(choices[0])})"
+        rows.append((option + _metavar(option, kind), help_text))
+
+    width = max(len(name) for name, _ in rows) + 2
+    lines = [format_usage(spec), '']
+    if description:
+        lines += [description, '']
+    lines.append('options:')
+    lines += [f"  {name.ljust(width)}{text}" for name, text in rows]
+    if epilog:
+        lines.append(epilog.rstrip())
+    return '\n'.join(lines)
+
+
+def _error(spec: dict, message: str) -> None:
+    """Print usage and an error message, then exit with status 2."""
+    print(format_usage(spec), file=sys.stderr)
+    print(f"{Path(sys.argv[0]).name}: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def parse(argv: list, spec: dict, description: str = '', epilog: str = '') -> SimpleNamespace:
+    """
+    Parse command-line arguments against an option spec.
+
+    Args:
+        argv: Arguments without the program name (e.g. sys.argv[1:])
+        spec: Dict mapping option name to (kind, default, help[, choices]),
+              where kind is 'str', 'list' or 'flag' and default may be REQUIRED
+        description: Text shown at the top of --help
+        epilog: Text shown at the bottom of --help
+
+    Returns:
+        Namespace with one attribute per option ('--no-merge' -> no_merge)
+    """
+    values = {}
+    i = 0
+
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if arg in ('-h', '--help'):
+            print(format_help(spec, description, epilog))
+            sys.exit(0)
+
+        option, has_inline, inline = arg.partition('=')
+        if option not in spec:
+            _error(spec, f"unrecognized arguments: {arg}")
+
+        kind = spec[option][0]
+        if kind == 'flag':
+            if has_inline:
+                _error(spec, f"argument {option}: ignored explicit argument '{inline}'")
+            values[option] = True
+            continue
+
+        if has_inline:
+            items = [inline]
+        else:
+            items = []
+            while i < len(argv) and not argv[i].startswith('--'):
+                items.append(argv[i])
+                i += 1
+                if kind == 'str':
+                    break
+
+        if not items:
+            expected = 'at least one argument' if kind == 'list' else 'one argument'
+            _error(spec, f"argument {option}: expected {expected}")
+
+        values[option] = items if kind == 'list' else items[0]
+
+    namespace = SimpleNamespace()
+    for option, (kind, default, _help, *choices) in spec.items():
+        if option in values:
+            value = values[option]
+        elif default is REQUIRED:
+            _error(spec, f"the following arguments are required: {option}")
+        else:
+            value = False if kind == 'flag' else default
+
+        if choices and value not in choices[0]:
+            allowed = ', '.join(repr(c) for c in choices[0])
+            _error(spec, f"argument {option}: invalid choice: {value!r} (choose from {allowed})")
+
+        setattr(namespace, _dest(option), value)
+
+    return namespace
@@ -14,31 +14,34 @@ from pathlib import Path
 # Add parent directory to path to import src module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import argparse
 import logging
 from datetime import datetime
 
-from src.data_fetcher import StockDataFetcher
-from src.data_storage import DataStorage
-from config.settings import DEFAULT_SYMBOLS, DEFAULT_START_DATE, LOG_LEVEL, LOG_FORMAT
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/download_daily.log')
-    ]
-)
+from src.logging_setup import configure
+from _cli import parse
+from config.settings import DEFAULT_SYMBOLS, DEFAULT_START_DATE
 
 logger = logging.getLogger(__name__)
 
 
 def main():
-    parser = argparse.ArgumentParser(
+    args = parse(
+        sys.argv[1:],
+        {
+            '--symbols': (
+                'list',
+                DEFAULT_SYMBOLS,
+                f'Stock ticker symbols (default: {", ".join(DEFAULT_SYMBOLS)})'
+            ),
+            '--start': (
+                'str',
+                DEFAULT_START_DATE,
+                f'Start date YYYY-MM-DD (default: {DEFAULT_START_DATE} for max available)'
+            ),
+            '--end': ('str', None, 'End date YYYY-MM-DD (default: today)'),
+            '--no-merge': ('flag', False, 'Do not merge with existing data (overwrite instead)'),
+        },
         description='Download daily stock price data',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   Download default symbols with maximum available data:
@@ -55,34 +58,7 @@ Examples:
         """
     )
 
-    parser.add_argument(
-        '--symbols',
-        nargs='+',
-        default=DEFAULT_SYMBOLS,
-        help=f'Stock ticker symbols (default: {", ".join(DEFAULT_SYMBOLS)})'
-    )
-
-    parser.add_argument(
-        '--start',
-        type=str,
-        default=DEFAULT_START_DATE,
-        help=f'Start date YYYY-MM-DD (default: {DEFAULT_START_DATE} for max available)'
-    )
-
-    parser.add_argument(
-        '--end',
-        type=str,
-        default=None,
-        help='End date YYYY-MM-DD (default: today)'
-    )
-
-    parser.add_argument(
-        '--no-merge',
-        action='store_true',
-        help='Do not merge with existing data (overwrite instead)'
-    )
-
-    args = parser.parse_args()
+    configure(Path(__file__).stem)
 
     # Print header
     print("=" * 70)
@@ -95,6 +71,10 @@ Examples:
     print("=" * 70)
     print()
 
+    # Imported here so --help and argument errors don't pay for yfinance/pandas
+    from src.data_fetcher import StockDataFetcher
+    from src.data_storage import DataStorage
+
     # Initialize fetcher and storage
     fetcher = StockDataFetcher()
     storage = DataStorage()
@@ -104,17 +84,18 @@ Examples:
         logger.info("Starting daily data download...")
         start_time = datetime.now()
 
-        results = fetcher.download_daily(
-            symbols=args.symbols,
-            start_date=args.start,
-            end_date=args.end,
-            progress=True
+        # Save each symbol as soon as it is downloaded, keeping only record counts
+        record_counts = storage.save_many(
+            fetcher.download_daily_iter(
+                symbols=args.symbols,
+                start_date=args.start,
+                end_date=args.end,
+                progress=True
+            ),
+            'daily',
+            merge=not args.no_merge
         )
 
-        # Save to storage
-        for symbol, df in results.items():
-            storage.save_daily(symbol, df, merge=not args.no_merge)
-
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
 
@@ -124,13 +105,13 @@ Examples:
         print(" Download Summary")
         print("=" * 70)
         print(f"Total symbols: {len(args.symbols)}")
-        print(f"Successful: {len(results)}")
-        print(f"Failed: {len(args.symbols) - len(results)}")
+        print(f"Successful: {len(record_counts)}")
+        print(f"Failed: {len(args.symbols) - len(record_counts)}")
         print(f"Duration: {duration:.1f} seconds")
         print()
 
         # Print data info
-        for symbol in results:
+        for symbol in record_counts:
             date_range = storage.get_date_range(symbol, 'daily')
             if date_range:
                 print(f"  {symbol}: {date_range[0]} to {date_range[1]}")
@@ -15,39 +15,44 @@ from pathlib import Path
 # Add parent directory to path to import src module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import argparse
 import logging
 from datetime import datetime
 
-from src.data_fetcher import StockDataFetcher
-from src.data_storage import DataStorage
+from src.logging_setup import configure
+from _cli import parse
 from config.settings import (
     DEFAULT_SYMBOLS,
     DEFAULT_PERIOD,
     DEFAULT_INTERVAL,
     VALID_INTERVALS,
-    VALID_PERIODS,
-    LOG_LEVEL,
-    LOG_FORMAT
-)
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/download_hourly.log')
-    ]
+    VALID_PERIODS
 )
 
 logger = logging.getLogger(__name__)
 
 
 def main():
-    parser = argparse.ArgumentParser(
+    args = parse(
+        sys.argv[1:],
+        {
+            '--symbols': (
+                'list',
+                DEFAULT_SYMBOLS,
+                f'Stock ticker symbols (default: {", ".join(DEFAULT_SYMBOLS)})'
+            ),
+            '--period': (
+                'str',
+                DEFAULT_PERIOD,
+                f'Time period (default: {DEFAULT_PERIOD}). Options: {", ".join(VALID_PERIODS)}'
+            ),
+            '--interval': (
+                'str',
+                DEFAULT_INTERVAL,
+                f'Data interval (default: {DEFAULT_INTERVAL}). Options: {", ".join(VALID_INTERVALS)}'
+            ),
+            '--no-merge': ('flag', False, 'Do not merge with existing data (overwrite instead)'),
+        },
         description='Download hourly/intraday stock price data',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=f"""
 Examples:
   Download default symbols with hourly data (2 years):
@@ -70,34 +75,7 @@ Note: For hourly (1h) data, yfinance provides ~730 days (2 years) maximum.
         """
     )
 
-    parser.add_argument(
-        '--symbols',
-        nargs='+',
-        default=DEFAULT_SYMBOLS,
-        help=f'Stock ticker symbols (default: {", ".join(DEFAULT_SYMBOLS)})'
-    )
-
-    parser.add_argument(
-        '--period',
-        type=str,
-        default=DEFAULT_PERIOD,
-        help=f'Time period (default: {DEFAULT_PERIOD}). Options: {", ".join(VALID_PERIODS)}'
-    )
-
-    parser.add_argument(
-        '--interval',
-        type=str,
-        default=DEFAULT_INTERVAL,
-        help=f'Data interval (default: {DEFAULT_INTERVAL}). Options: {", ".join(VALID_INTERVALS)}'
-    )
-
-    parser.add_argument(
-        '--no-merge',
-        action='store_true',
-        help='Do not merge with existing data (overwrite instead)'
-    )
-
-    args = parser.parse_args()
+    configure(Path(__file__).stem)
 
     # Validate interval
     if args.interval not in VALID_INTERVALS:
@@ -127,6 +105,10 @@ Note: For hourly (1h) data, yfinance provides ~730 days (2 years) maximum.
         print("WARNING: For hourly data, maximum available period is ~730 days (2 years)")
         print()
 
+    # Imported here so --help and argument errors don't pay for yfinance/pandas
+    from src.data_fetcher import StockDataFetcher
+    from src.data_storage import DataStorage
+
     # Initialize fetcher and storage
     fetcher = StockDataFetcher()
     storage = DataStorage()
@@ -136,17 +118,19 @@ Note: For hourly (1h) data, yfinance provides ~730 days (2 years) maximum.
         logger.info(f"Starting {args.interval} data download...")
         start_time = datetime.now()
 
-        results = fetcher.download_hourly(
-            symbols=args.symbols,
-            period=args.period,
+        # Save each symbol as soon as it is downloaded, keeping only record counts
+        record_counts = storage.save_many(
+            fetcher.download_hourly_iter(
+                symbols=args.symbols,
+                period=args.period,
+                interval=args.interval,
+                progress=True
+            ),
+            'hourly',
             interval=args.interval,
-            progress=True
+            merge=not args.no_merge
         )
 
-        # Save to storage
-        for symbol, df in results.items():
-            storage.save_hourly(symbol, df, interval=args.interval, merge=not args.no_merge)
-
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
 
@@ -156,17 +140,16 @@ Note: For hourly (1h) data, yfinance provides ~730 days (2 years) maximum.
         print(" Download Summary")
         print("=" * 70)
         print(f"Total symbols: {len(args.symbols)}")
-        print(f"Successful: {len(results)}")
-        print(f"Failed: {len(args.symbols) - len(results)}")
+        print(f"Successful: {len(record_counts)}")
+        print(f"Failed: {len(args.symbols) - len(record_counts)}")
         print(f"Duration: {duration:.1f} seconds")
         print()
 
         # Print data info
-        for symbol in results:
-            date_range = storage.get_date_range(symbol, 'hourly')
+        for symbol, count in record_counts.items():
+            date_range = storage.get_date_range(symbol, 'hourly', interval=args.interval)
             if date_range:
-                df = results[symbol]
-                print(f"  {symbol}: {date_range[0]} to {date_range[1]} ({len(df)} records)")
+                print(f"  {symbol}: {date_range[0]} to {date_range[1]} ({count} records)")
 
         print("=" * 70)
         print()
@@ -14,31 +14,44 @@ from pathlib import Path
 # Add parent directory to path to import src module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import argparse
 import logging
-from datetime import datetime, timedelta
-
-from src.data_fetcher import StockDataFetcher
-from src.data_storage import DataStorage
-from config.settings import DEFAULT_INTERVAL, LOG_LEVEL, LOG_FORMAT
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/update_data.log')
-    ]
-)
+from collections import defaultdict
+from datetime import datetime
+
+from src.logging_setup import configure
+from _cli import parse, REQUIRED
+from config.settings import DEFAULT_INTERVAL
 
 logger = logging.getLogger(__name__)
 
+# Per-symbol status messages
+STATUS_SKIP = "SKIP (no existing data)"
+STATUS_UP_TO_DATE = "UP-TO-DATE"
+STATUS_FAILED = "FAILED"
+
 
 def main():
-    parser = argparse.ArgumentParser(
+    args = parse(
+        sys.argv[1:],
+        {
+            '--type': (
+                'str',
+                REQUIRED,
+                'Type of data to update',
+                ('daily', 'hourly')
+            ),
+            '--symbols': (
+                'list',
+                None,
+                'Specific symbols to update (default: all available symbols)'
+            ),
+            '--interval': (
+                'str',
+                DEFAULT_INTERVAL,
+                f'Interval for hourly data (default: {DEFAULT_INTERVAL})'
+            ),
+        },
         description='Update existing stock data with latest prices',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   Update all daily data:
@@ -52,28 +65,10 @@ Examples:
         """
     )
 
-    parser.add_argument(
-        '--type',
-        choices=['daily', 'hourly'],
-        required=True,
-        help='Type of data to update (daily or hourly)'
-    )
-
-    parser.add_argument(
-        '--symbols',
-        nargs='+',
-        default=None,
-        help='Specific symbols to update (default: all available symbols)'
-    )
-
-    parser.add_argument(
-        '--interval',
-        type=str,
-        default=DEFAULT_INTERVAL,
-        help=f'Interval for hourly data (default: {DEFAULT_INTERVAL})'
-    )
+    configure(Path(__file__).stem)
 
-    args = parser.parse_args()
+    # Block-buffer stdout; status lines are flushed once per symbol below
+    sys.stdout.reconfigure(line_buffering=False)
 
     # Print header
     print("=" * 70)
@@ -85,8 +80,12 @@ Examples:
     print("=" * 70)
     print()
 
-    # Initialize fetcher and storage
-    fetcher = StockDataFetcher()
+    # Imported here so --help and argument errors don't pay for yfinance/pandas
+    from src.data_fetcher import StockDataFetcher
+    from src.data_storage import DataStorage
+
+    # Initialize fetcher and storage; updates always need fresh bars
+    fetcher = StockDataFetcher(use_cache=False)
     storage = DataStorage()
 
     # Get symbols to update
@@ -101,70 +100,74 @@ Examples:
     print(f"Symbols to update: {', '.join(symbols)}")
     print()
 
-    # Update each symbol
+    # Update symbols
     try:
         logger.info(f"Starting {args.type} data update...")
         start_time = datetime.now()
+        today = start_time.strftime('%Y-%m-%d')
 
         updated_count = 0
         failed_count = 0
 
+        # Group symbols that need the same download so each group is one request
+        buckets = defaultdict(list)
         for symbol in symbols:
-            print(f"Updating {symbol}...", end=" ")
-
             try:
                 # Get existing date range
-                date_range = storage.get_date_range(symbol, args.type)
-                if not date_range:
-                    print("SKIP (no existing data)")
-                    continue
-
-                last_date = date_range[1]
-                today = datetime.now().strftime('%Y-%m-%d')
-
-                # Check if update is needed
-                if last_date >= today:
-                    print("UP-TO-DATE")
-                    continue
-
-                # Download new data
+                date_range = storage.get_date_range(symbol, args.type, interval=args.interval)
+            except Exception as e:
+                logger.error(f"Failed to update {symbol}: {str(e)}")
+                print(f"Updating {symbol}... ERROR: {str(e)}", flush=True)
+                failed_count += 1
+                continue
+
+            if not date_range:
+                print(f"Updating {symbol}... {STATUS_SKIP}", flush=True)
+            elif date_range[1] >= today:
+                # No update needed
+                print(f"Updating {symbol}... {STATUS_UP_TO_DATE}", flush=True)
+            elif args.type == 'daily':
+                # Download from last date to today
+                buckets[date_range[1]].append(symbol)
+            else:
+                # For hourly, every symbol downloads the same recent period
+                buckets[None].append(symbol)
+
+        for last_date, bucket_symbols in buckets.items():
+            try:
+                # Download new data and save (merge with existing) as it arrives
                 if args.type == 'daily':
-                    # Download from last date to today
-                    results = fetcher.download_daily(
-                        symbols=[symbol],
+                    downloads = fetcher.download_daily_iter(
+                        symbols=bucket_symbols,
                         start_date=last_date,
                         end_date=None,
                         progress=False
                     )
                 else:  # hourly
-                    # For hourly, download recent period and merge
-                    results = fetcher.download_hourly(
-                        symbols=[symbol],
+                    downloads = fetcher.download_hourly_iter(
+                        symbols=bucket_symbols,
                         period='5d',  # Last 5 days to ensure overlap
                         interval=args.interval,
                         progress=False
                     )
+                record_counts = storage.save_many(downloads, args.type, interval=args.interval, merge=True)
 
-                # Save (merge with existing)
-                if symbol in results:
-                    df = results[symbol]
-                    if args.type == 'daily':
-                        storage.save_daily(symbol, df, merge=True)
+                lines = []
+                for symbol in bucket_symbols:
+                    if symbol in record_counts:
+                        lines.append(f"Updating {symbol}... OK (+{record_counts[symbol]} records)")
+                        updated_count += 1
                     else:
-                        storage.save_hourly(symbol, df, interval=args.interval, merge=True)
-
-                    # Get new record count
-                    new_records = len(df)
-                    print(f"OK (+{new_records} records)")
-                    updated_count += 1
-                else:
-                    print("FAILED")
-                    failed_count += 1
+                        lines.append(f"Updating {symbol}... {STATUS_FAILED}")
+                        failed_count += 1
 
             except Exception as e:
-                print(f"ERROR: {str(e)}")
-                logger.error(f"Failed to update {symbol}: {str(e)}")
-                failed_count += 1
+                logger.error(f"Failed to update {', '.join(bucket_symbols)}: {str(e)}")
+                lines = [f"Updating {symbol}... ERROR: {str(e)}" for symbol in bucket_symbols]
+                failed_count += len(bucket_symbols)
+
+            # One write and one flush per download group
+            print('\n'.join(lines), flush=True)
 
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -1,15 +1,38 @@
 """Stock analysis package - Core modules for downloading, storing, and analyzing stock data."""
 
+import importlib
+
 __version__ = '0.1.0'
 
-from .data_fetcher import StockDataFetcher
-from .data_storage import DataStorage
-from .data_utils import validate_symbol, validate_date_range, format_dataframe
+# Public names are imported on first access (PEP 562) so that importing one
+# submodule doesn't drag in yfinance and pandas through the others.
+_LAZY_IMPORTS = {
+    'StockDataFetcher': '.data_fetcher',
+    'DataStorage': '.data_storage',
+    'validate_symbol': '.data_utils',
+    'validate_symbols': '.data_utils',
+    'validate_date_range': '.data_utils',
+    'format_dataframe': '.data_utils',
+}
 
 __all__ = [
     'StockDataFetcher',
     'DataStorage',
     'validate_symbol',
+    'validate_symbols',
     'validate_date_range',
     'format_dataframe',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -0,0 +1,152 @@
+"""
+On-disk cache for raw yfinance responses.
+"""
+
+import hashlib
+import io
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from config.settings import CACHE_DB, CACHE_TTL_DAILY, CACHE_TTL_INTRADAY, ensure_dirs
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStore:
+    """Cache downloaded DataFrames in a SQLite file as Parquet blobs."""
+
+    def __init__(
+        self,
+        db_path: Path = CACHE_DB,
+        max_age: int = max(CACHE_TTL_DAILY, CACHE_TTL_INTRADAY)
+    ):
+        """
+        Initialize the cache store.
+
+        The database file is only created on first use.
+
+        Args:
+            db_path: Path to the SQLite cache file
+            max_age: Rows older than this many seconds are pruned on every put()
+        """
+        self.db_path = Path(db_path)
+        self.max_age = max_age
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        symbol: str,
+        interval: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        period: Optional[str] = None
+    ) -> str:
+        """
+        Build the cache key for a download request.
+
+        Args:
+            symbol: Stock ticker symbol
+            interval: Data interval
+            start: Start date (for historical data)
+            end: End date (for historical data)
+            period: Period string (for recent data)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        raw = f"{symbol}|{interval}|{start}|{end}|{period}"
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table on first use."""
+        if self._conn is None:
+            ensure_dirs(self.db_path.parent)
+            # Shared by the fetcher's worker threads, guarded by self._lock
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "cache_key TEXT PRIMARY KEY, "
+                "fetched_at INTEGER, "
+                "parquet_blob BLOB)"
+            )
+        return self._conn
+
+    def get(self, key: str, ttl: int) -> Optional[pd.DataFrame]:
+        """
+        Look up a cached DataFrame.
+
+        Args:
+            key: Cache key from make_key()
+            ttl: Maximum age in seconds
+
+        Returns:
+            Cached DataFrame or None if missing or expired
+        """
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT fetched_at, parquet_blob FROM responses WHERE cache_key = ?",
+                    (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache lookup failed: {str(e)}")
+            return None
+
+        if row is None:
+            return None
+
+        fetched_at, blob = row
+        if time.time() - fetched_at > ttl:
+            self._delete(key)
+            return None
+
+        return pd.read_parquet(io.BytesIO(blob))
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """
+        Store a DataFrame in the cache.
+
+        Args:
+            key: Cache key from make_key()
+            df: DataFrame to cache
+        """
+        buf = io.BytesIO()
+        df.to_parquet(buf, index=True)
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                now = int(time.time())
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (key, now, buf.getvalue())
+                )
+                # Most keys are never requested again, so drop stale rows here
+                conn.execute("DELETE FROM responses WHERE fetched_at < ?", (now - self.max_age,))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache write failed: {str(e)}")
+
+    def _delete(self, key: str) -> None:
+        """Remove one cached response."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM responses WHERE cache_key = ?", (key,))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache delete failed: {str(e)}")
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
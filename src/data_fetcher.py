@@ -4,13 +4,38 @@ Stock data fetching module using yfinance.
 
 import yfinance as yf
 import pandas as pd
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterator, Tuple
+import asyncio
+import importlib.util
 import logging
+import random
 import time
-from datetime import datetime
-
-from .data_utils import validate_symbol, validate_date_range, format_dataframe, validate_price_data
-from config.settings import MAX_RETRIES, RETRY_DELAY, TIMEOUT
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+
+from .cache_store import CacheStore
+from .data_utils import (
+    validate_symbol,
+    validate_symbols,
+    validate_date_range,
+    format_dataframe,
+    validate_price_data,
+    standardize_column
+)
+from config.settings import (
+    MAX_RETRIES,
+    RETRY_DELAY,
+    TIMEOUT,
+    MAX_WORKERS,
+    CACHE_ENABLED,
+    CACHE_TTL_DAILY,
+    CACHE_TTL_INTRADAY,
+    ASYNC_CONCURRENCY,
+    YAHOO_CHART_URL,
+    USER_AGENT,
+    INFO_CACHE_SECONDS,
+    HTTP_POOL_SIZE
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +43,31 @@ logger = logging.getLogger(__name__)
 class StockDataFetcher:
     """Fetch stock data from Yahoo Finance using yfinance."""
 
-    def __init__(self, max_retries: int = MAX_RETRIES, retry_delay: int = RETRY_DELAY):
+    def __init__(
+        self,
+        max_retries: int = MAX_RETRIES,
+        retry_delay: int = RETRY_DELAY,
+        max_workers: int = MAX_WORKERS,
+        use_cache: bool = CACHE_ENABLED
+    ):
         """
         Initialize the data fetcher.
 
         Args:
             max_retries: Maximum number of retry attempts
             retry_delay: Delay in seconds between retries
+            max_workers: Maximum number of concurrent per-symbol downloads
+            use_cache: Reuse recent responses from the on-disk cache
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_workers = max_workers
+        self.cache = CacheStore() if use_cache else None
+        # One keep-alive session shared by every request, including worker threads
+        self._session = _build_session()
+        # get_info/get_latest_price results keyed by (symbol, time bucket)
+        self._info_cache: Dict[Tuple[str, int], Dict] = {}
+        self._price_cache: Dict[Tuple[str, int], Optional[float]] = {}
 
     def download_daily(
         self,
@@ -48,18 +88,29 @@ class StockDataFetcher:
         Returns:
             Dictionary mapping symbol to DataFrame
         """
-        # Validate inputs
-        if not symbols:
-            raise ValueError("Symbols list cannot be empty")
+        return dict(self.download_daily_iter(symbols, start_date, end_date, progress))
 
-        symbols = [s.upper() for s in symbols]
-        invalid_symbols = [s for s in symbols if not validate_symbol(s)]
-        if invalid_symbols:
-            logger.warning(f"Invalid symbols will be skipped: {invalid_symbols}")
-            symbols = [s for s in symbols if validate_symbol(s)]
+    def download_daily_iter(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        progress: bool = True
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Download daily OHLCV data, yielding each symbol as soon as it is ready.
 
-        if not symbols:
-            raise ValueError("No valid symbols to download")
+        Args:
+            symbols: List of stock ticker symbols
+            start_date: Start date (YYYY-MM-DD) or None for maximum available
+            end_date: End date (YYYY-MM-DD) or None for today
+            progress: Show progress bar
+
+        Yields:
+            (symbol, DataFrame) tuples in completion order
+        """
+        # Validate inputs
+        symbols = self._clean_symbols(symbols)
 
         # Validate dates
         start_dt, end_dt = validate_date_range(start_date, end_date)
@@ -67,28 +118,13 @@ class StockDataFetcher:
         logger.info(f"Downloading daily data for {len(symbols)} symbols...")
         logger.info(f"Date range: {start_date or 'max available'} to {end_date or 'today'}")
 
-        results = {}
-
-        for symbol in symbols:
-            logger.info(f"Fetching {symbol}...")
-            df = self._download_with_retry(
-                symbol,
-                start=start_date,
-                end=end_date,
-                interval='1d',
-                progress=progress
-            )
-
-            if df is not None and not df.empty:
-                df = format_dataframe(df, symbol)
-                df = validate_price_data(df, symbol)
-                results[symbol] = df
-                logger.info(f"✓ {symbol}: Downloaded {len(df)} records")
-            else:
-                logger.error(f"✗ {symbol}: Failed to download data")
-
-        logger.info(f"Download complete: {len(results)}/{len(symbols)} symbols successful")
-        return results
+        yield from self._iter_results(
+            symbols,
+            start=start_date,
+            end=end_date,
+            interval='1d',
+            progress=progress
+        )
 
     def download_hourly(
         self,
@@ -110,18 +146,29 @@ class StockDataFetcher:
         Returns:
             Dictionary mapping symbol to DataFrame
         """
-        # Validate inputs
-        if not symbols:
-            raise ValueError("Symbols list cannot be empty")
+        return dict(self.download_hourly_iter(symbols, period, interval, progress))
 
-        symbols = [s.upper() for s in symbols]
-        invalid_symbols = [s for s in symbols if not validate_symbol(s)]
-        if invalid_symbols:
-            logger.warning(f"Invalid symbols will be skipped: {invalid_symbols}")
-            symbols = [s for s in symbols if validate_symbol(s)]
+    def download_hourly_iter(
+        self,
+        symbols: List[str],
+        period: str = '730d',
+        interval: str = '1h',
+        progress: bool = True
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Download hourly/intraday data, yielding each symbol as soon as it is ready.
 
-        if not symbols:
-            raise ValueError("No valid symbols to download")
+        Args:
+            symbols: List of stock ticker symbols
+            period: Time period (see download_hourly)
+            interval: Data interval (see download_hourly)
+            progress: Show progress bar
+
+        Yields:
+            (symbol, DataFrame) tuples in completion order
+        """
+        # Validate inputs
+        symbols = self._clean_symbols(symbols)
 
         logger.info(f"Downloading {interval} data for {len(symbols)} symbols...")
         logger.info(f"Period: {period}, Interval: {interval}")
@@ -132,28 +179,263 @@ class StockDataFetcher:
                 f"Period '{period}' may be limited."
             )
 
-        results = {}
+        yield from self._iter_results(
+            symbols,
+            period=period,
+            interval=interval,
+            progress=progress
+        )
+
+    def _clean_symbols(self, symbols: List[str]) -> List[str]:
+        """
+        Uppercase and validate symbols in a single pass.
+
+        Args:
+            symbols: List of stock ticker symbols
+
+        Returns:
+            List of valid uppercase symbols (invalid ones are logged and dropped)
+
+        Raises:
+            ValueError: If the list is empty or contains no valid symbols
+        """
+        if not symbols:
+            raise ValueError("Symbols list cannot be empty")
+
+        upper = [s.upper() for s in symbols]
+        cleaned, invalid = [], []
+        for u, valid in zip(upper, validate_symbols(upper)):
+            (cleaned if valid else invalid).append(u)
+
+        if invalid:
+            logger.warning(f"Invalid symbols will be skipped: {invalid}")
+
+        if not cleaned:
+            raise ValueError("No valid symbols to download")
+
+        return cleaned
+
+    def _iter_results(
+        self,
+        symbols: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        period: Optional[str] = None,
+        interval: str = '1d',
+        progress: bool = False
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Fetch, format and validate symbols, yielding each one as it completes.
+
+        Args:
+            symbols: List of validated, uppercase ticker symbols
+            start: Start date (for historical data)
+            end: End date (for historical data)
+            period: Period string (for recent data)
+            interval: Data interval
+            progress: Show progress bar
+
+        Yields:
+            (symbol, DataFrame) tuples in completion order
+        """
+        completed = set()
+
+        for symbol, df in self._fetch(
+            symbols,
+            start=start,
+            end=end,
+            period=period,
+            interval=interval,
+            progress=progress
+        ):
+            df = format_dataframe(df, symbol)
+            df = validate_price_data(df, symbol)
+            completed.add(symbol)
+            logger.info(f"✓ {symbol}: Downloaded {len(df)} records")
+            yield symbol, df
 
         for symbol in symbols:
-            logger.info(f"Fetching {symbol}...")
-            df = self._download_with_retry(
-                symbol,
-                period=period,
+            if symbol not in completed:
+                logger.error(f"✗ {symbol}: Failed to download data")
+
+        logger.info(f"Download complete: {len(completed)}/{len(symbols)} symbols successful")
+
+    def _fetch(
+        self,
+        symbols: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        period: Optional[str] = None,
+        interval: str = '1d',
+        progress: bool = False
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Fetch raw data for symbols, trying the cache before the network.
+
+        Only requests with a fixed end date in the past use the cache.
+        Uncached symbols are downloaded in one batch; anything the batch
+        misses is retried per symbol.
+
+        Args:
+            symbols: List of stock ticker symbols
+            start: Start date (for historical data)
+            end: End date (for historical data)
+            period: Period string (for recent data)
+            interval: Data interval
+            progress: Show progress bar
+
+        Yields:
+            (symbol, raw DataFrame) tuples; failed symbols are omitted
+        """
+        params = {'start': start, 'end': end, 'period': period, 'interval': interval}
+        pending = list(symbols)
+        use_cache = self.cache is not None and self._is_cacheable(end)
+
+        if use_cache:
+            ttl = self._cache_ttl(interval)
+            pending = []
+            for symbol in symbols:
+                df = self.cache.get(CacheStore.make_key(symbol, **params), ttl)
+                if df is None:
+                    pending.append(symbol)
+                else:
+                    logger.info(f"Loaded {symbol} from cache")
+                    yield symbol, df
+
+        if not pending:
+            return
+
+        batch = self._download_batch(pending, progress=progress, **params)
+        missing = [s for s in pending if s not in batch]
+        fetched = batch.items()
+        if missing:
+            fetched = chain(fetched, self._download_missing(missing, progress=progress, **params))
+
+        for symbol, df in fetched:
+            if use_cache:
+                self.cache.put(CacheStore.make_key(symbol, **params), df)
+            yield symbol, df
+
+    def _download_batch(
+        self,
+        symbols: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        period: Optional[str] = None,
+        interval: str = '1d',
+        progress: bool = False
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download several symbols with a single threaded yf.download call.
+
+        Symbols missing from the response (or returned empty) are left out of
+        the result so the caller can fall back to per-symbol retries.
+
+        Args:
+            symbols: List of stock ticker symbols
+            start: Start date (for historical data)
+            end: End date (for historical data)
+            period: Period string (for recent data)
+            interval: Data interval
+            progress: Show progress bar
+
+        Returns:
+            Dictionary mapping symbol to raw DataFrame
+        """
+        # Use period or start/end
+        if period:
+            date_kwargs = {'period': period}
+        else:
+            date_kwargs = {'start': start, 'end': end}
+
+        try:
+            # auto_adjust/actions/ignore_tz match the Ticker.history defaults so
+            # batch and per-symbol results share the same columns and index
+            df = yf.download(
+                tickers=symbols,
                 interval=interval,
-                progress=progress
+                threads=min(len(symbols), 10),
+                group_by='ticker',
+                auto_adjust=True,
+                actions=True,
+                ignore_tz=False,
+                progress=progress,
+                timeout=TIMEOUT,
+                session=self._session,
+                **date_kwargs
             )
+        except Exception as e:
+            logger.warning(f"Batch download failed for {symbols}: {str(e)}")
+            return {}
 
-            if df is not None and not df.empty:
-                df = format_dataframe(df, symbol)
-                df = validate_price_data(df, symbol)
-                results[symbol] = df
-                logger.info(f"✓ {symbol}: Downloaded {len(df)} records")
-            else:
-                logger.error(f"✗ {symbol}: Failed to download data")
+        if df is None or df.empty:
+            return {}
+
+        # A single ticker may come back without the ticker column level
+        if not isinstance(df.columns, pd.MultiIndex):
+            return {symbols[0]: df} if len(symbols) == 1 else {}
+
+        # Normalize the wide frame once for every ticker, then split it
+        df = df.rename(columns=standardize_column, level=1)
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+        df = df.dropna(how='all')
+
+        results = {}
+        tickers = set(df.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol not in tickers:
+                continue
+            symbol_df = df.xs(symbol, level=0, axis=1).dropna(how='all')
+            if not symbol_df.empty:
+                results[symbol] = symbol_df
 
-        logger.info(f"Download complete: {len(results)}/{len(symbols)} symbols successful")
         return results
 
+    def _download_missing(
+        self,
+        symbols: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        period: Optional[str] = None,
+        interval: str = '1d',
+        progress: bool = False
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Download symbols one by one in a thread pool, with retries.
+
+        Args:
+            symbols: List of stock ticker symbols
+            start: Start date (for historical data)
+            end: End date (for historical data)
+            period: Period string (for recent data)
+            interval: Data interval
+            progress: Show progress
+
+        Yields:
+            (symbol, raw DataFrame) tuples as downloads finish; failed symbols are omitted
+        """
+        workers = max(1, min(len(symbols), self.max_workers))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for symbol in symbols:
+                logger.info(f"Fetching {symbol} individually...")
+                future = executor.submit(
+                    self._download_with_retry,
+                    symbol,
+                    start=start,
+                    end=end,
+                    period=period,
+                    interval=interval,
+                    progress=progress
+                )
+                futures[future] = symbol
+
+            for future in as_completed(futures):
+                df = future.result()
+                if df is not None and not df.empty:
+                    yield futures[future], df
+
     def _download_with_retry(
         self,
         symbol: str,
@@ -179,7 +461,7 @@ class StockDataFetcher:
         """
         for attempt in range(self.max_retries):
             try:
-                ticker = yf.Ticker(symbol)
+                ticker = yf.Ticker(symbol, session=self._session)
 
                 # Use period or start/end
                 if period:
@@ -208,18 +490,203 @@ class StockDataFetcher:
                 logger.warning(f"Attempt {attempt + 1}/{self.max_retries} failed for {symbol}: {str(e)}")
 
                 if attempt < self.max_retries - 1:
-                    logger.info(f"Retrying in {self.retry_delay} seconds...")
-                    time.sleep(self.retry_delay)
+                    # Jitter keeps parallel workers from retrying in lockstep
+                    delay = self.retry_delay * (1 + random.random())
+                    logger.info(f"Retrying {symbol} in {delay:.1f} seconds...")
+                    time.sleep(delay)
                 else:
                     logger.error(f"All retry attempts failed for {symbol}")
                     return None
 
         return None
 
+    async def download_daily_async(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download daily OHLCV data concurrently from Yahoo's chart API.
+
+        Requires aiohttp. A failing symbol backs off on its own without
+        holding up the others.
+
+        Args:
+            symbols: List of stock ticker symbols
+            start_date: Start date (YYYY-MM-DD) or None for maximum available
+            end_date: End date (YYYY-MM-DD) or None for today
+
+        Returns:
+            Dictionary mapping symbol to DataFrame
+        """
+        # Validate inputs
+        symbols = self._clean_symbols(symbols)
+
+        # Validate dates
+        start_dt, end_dt = validate_date_range(start_date, end_date)
+
+        logger.info(f"Downloading daily data for {len(symbols)} symbols (async)...")
+        logger.info(f"Date range: {start_date or 'max available'} to {end_date or 'today'}")
+
+        return await self._fetch_async(symbols, start=start_date, end=end_date, interval='1d')
+
+    async def download_hourly_async(
+        self,
+        symbols: List[str],
+        period: str = '730d',
+        interval: str = '1h'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download hourly/intraday data concurrently from Yahoo's chart API.
+
+        Requires aiohttp. A failing symbol backs off on its own without
+        holding up the others.
+
+        Args:
+            symbols: List of stock ticker symbols
+            period: Time period (see download_hourly)
+            interval: Data interval (see download_hourly)
+
+        Returns:
+            Dictionary mapping symbol to DataFrame
+        """
+        # Validate inputs
+        symbols = self._clean_symbols(symbols)
+
+        logger.info(f"Downloading {interval} data for {len(symbols)} symbols (async)...")
+        logger.info(f"Period: {period}, Interval: {interval}")
+
+        return await self._fetch_async(symbols, period=period, interval=interval)
+
+    async def _fetch_async(
+        self,
+        symbols: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        period: Optional[str] = None,
+        interval: str = '1d'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch, format and validate symbols concurrently with aiohttp.
+
+        Args:
+            symbols: List of validated, uppercase ticker symbols
+            start: Start date (for historical data)
+            end: End date (for historical data)
+            period: Period string (for recent data)
+            interval: Data interval
+
+        Returns:
+            Dictionary mapping symbol to DataFrame (failed symbols omitted)
+        """
+        import aiohttp
+
+        params = {'start': start, 'end': end, 'period': period, 'interval': interval}
+        query = _chart_query(**params)
+        semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+        timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+
+        async with aiohttp.ClientSession(headers={'User-Agent': USER_AGENT}, timeout=timeout) as session:
+            frames = await asyncio.gather(*[
+                self._fetch_chart(session, semaphore, symbol, query, params)
+                for symbol in symbols
+            ])
+
+        results = {}
+        for symbol, df in zip(symbols, frames):
+            if df is not None and not df.empty:
+                df = format_dataframe(df, symbol)
+                df = validate_price_data(df, symbol)
+                results[symbol] = df
+                logger.info(f"✓ {symbol}: Downloaded {len(df)} records")
+            else:
+                logger.error(f"✗ {symbol}: Failed to download data")
+
+        logger.info(f"Download complete: {len(results)}/{len(symbols)} symbols successful")
+        return results
+
+    async def _fetch_chart(
+        self,
+        session,
+        semaphore: asyncio.Semaphore,
+        symbol: str,
+        query: Dict[str, str],
+        params: Dict[str, Optional[str]]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Download one symbol from the chart API with exponential backoff.
+
+        Args:
+            session: Shared aiohttp.ClientSession
+            semaphore: Limits concurrent requests to Yahoo
+            symbol: Stock ticker symbol
+            query: Chart API query parameters
+            params: Request parameters used for the cache key
+
+        Returns:
+            Raw DataFrame or None if all retries fail
+        """
+        use_cache = self.cache is not None and self._is_cacheable(params['end'])
+
+        if use_cache:
+            df = self.cache.get(CacheStore.make_key(symbol, **params), self._cache_ttl(params['interval']))
+            if df is not None:
+                logger.info(f"Loaded {symbol} from cache")
+                return df
+
+        for attempt in range(self.max_retries):
+            try:
+                async with semaphore:
+                    async with session.get(YAHOO_CHART_URL.format(symbol=symbol), params=query) as response:
+                        response.raise_for_status()
+                        payload = await response.json()
+
+                df = _chart_to_dataframe(payload, params['interval'])
+                if df is None or df.empty:
+                    logger.warning(f"No data returned for {symbol}")
+                    return None
+
+                if use_cache:
+                    self.cache.put(CacheStore.make_key(symbol, **params), df)
+                return df
+
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1}/{self.max_retries} failed for {symbol}: {str(e)}")
+
+                if attempt < self.max_retries - 1:
+                    # Exponential backoff with jitter; other symbols keep going meanwhile
+                    delay = self.retry_delay * (2 ** attempt) + random.random()
+                    logger.info(f"Retrying {symbol} in {delay:.1f} seconds...")
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error(f"All retry attempts failed for {symbol}")
+
+        return None
+
+    @staticmethod
+    def _is_cacheable(end: Optional[str]) -> bool:
+        """
+        Whether a request's result is fixed and safe to reuse.
+
+        Open-ended requests (no end date, or a relative period) return new bars
+        on every run, so only ranges ending before today are cached.
+        """
+        if end is None:
+            return False
+        return pd.Timestamp(end).normalize() < pd.Timestamp.now().normalize()
+
+    @staticmethod
+    def _cache_ttl(interval: str) -> int:
+        """Cache lifetime in seconds; intraday bars go stale faster than daily ones."""
+        return CACHE_TTL_INTRADAY if interval.endswith(('m', 'h')) else CACHE_TTL_DAILY
+
     def get_info(self, symbol: str) -> Dict:
         """
         Get stock information and metadata.
 
+        Responses are reused for up to INFO_CACHE_SECONDS.
+
         Args:
             symbol: Stock ticker symbol
 
@@ -230,8 +697,7 @@ class StockDataFetcher:
             raise ValueError(f"Invalid symbol: {symbol}")
 
         try:
-            ticker = yf.Ticker(symbol.upper())
-            return ticker.info
+            return dict(self._memoized(self._info_cache, self._fetch_info, symbol.upper()))
         except Exception as e:
             logger.error(f"Failed to get info for {symbol}: {str(e)}")
             return {}
@@ -240,6 +706,8 @@ class StockDataFetcher:
         """
         Get the latest available price for a symbol.
 
+        Prices are reused for up to INFO_CACHE_SECONDS.
+
         Args:
             symbol: Stock ticker symbol
 
@@ -250,11 +718,155 @@ class StockDataFetcher:
             raise ValueError(f"Invalid symbol: {symbol}")
 
         try:
-            ticker = yf.Ticker(symbol.upper())
-            hist = ticker.history(period='1d')
-            if not hist.empty:
-                return hist['Close'].iloc[-1]
-            return None
+            return self._memoized(self._price_cache, self._fetch_latest_price, symbol.upper())
         except Exception as e:
             logger.error(f"Failed to get latest price for {symbol}: {str(e)}")
             return None
+
+    @staticmethod
+    def _cache_bucket() -> int:
+        """Time bucket that rolls over every INFO_CACHE_SECONDS, expiring the memoized lookups."""
+        return int(time.time() // INFO_CACHE_SECONDS)
+
+    def _memoized(self, cache: Dict, fetch, symbol: str):
+        """Return fetch(symbol), reusing the result within the current time bucket."""
+        bucket = self._cache_bucket()
+        key = (symbol, bucket)
+        if key in cache:
+            return cache[key]
+
+        # Results from earlier buckets have expired
+        for stale in [k for k in list(cache) if k[1] != bucket]:
+            cache.pop(stale, None)
+        value = fetch(symbol)
+        cache[key] = value
+        return value
+
+    def _fetch_info(self, symbol: str) -> Dict:
+        """Fetch ticker.info."""
+        return yf.Ticker(symbol, session=self._session).info
+
+    def _fetch_latest_price(self, symbol: str) -> Optional[float]:
+        """Fetch the last close."""
+        hist = yf.Ticker(symbol, session=self._session).history(period='1d')
+        if not hist.empty:
+            return hist['Close'].iloc[-1]
+        return None
+
+
+def _build_session():
+    """
+    Create the HTTP session shared by all yfinance calls.
+
+    The session keeps TCP/TLS connections alive across symbols. yfinance
+    releases built on curl_cffi already share one pooled session internally
+    and reject requests sessions, so None is returned for those to let
+    yfinance manage its own.
+
+    Returns:
+        requests session, or None to use yfinance's default
+    """
+    if importlib.util.find_spec('curl_cffi') is not None:
+        return None
+
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount('https://', adapter)
+    return session
+
+
+def _chart_query(
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    period: Optional[str] = None,
+    interval: str = '1d'
+) -> Dict[str, str]:
+    """
+    Build chart API query parameters from download arguments.
+
+    Args:
+        start: Start date (for historical data)
+        end: End date (for historical data)
+        period: Period string (for recent data)
+        interval: Data interval
+
+    Returns:
+        Query parameter dictionary
+    """
+    query = {'interval': interval, 'events': 'div,splits', 'includePrePost': 'false'}
+
+    if period:
+        if period.endswith('d') and period[:-1].isdigit():
+            # The chart API only understands fixed ranges, so day counts become timestamps
+            now = int(time.time())
+            query['period1'] = str(now - int(period[:-1]) * 86400)
+            query['period2'] = str(now)
+        else:
+            query['range'] = period
+    elif start:
+        query['period1'] = str(int(pd.Timestamp(start).timestamp()))
+        query['period2'] = str(int(pd.Timestamp(end).timestamp()) if end else int(time.time()))
+    else:
+        query['range'] = 'max'
+
+    return query
+
+
+def _chart_to_dataframe(payload: Dict, interval: str) -> Optional[pd.DataFrame]:
+    """
+    Convert a chart API JSON response into an OHLCV DataFrame.
+
+    Prices are adjusted for splits and dividends, matching yfinance's
+    auto_adjust default.
+
+    Args:
+        payload: Decoded JSON response
+        interval: Data interval of the request
+
+    Returns:
+        DataFrame indexed by exchange-local timestamps, or None if empty
+    """
+    chart = payload.get('chart') or {}
+    if chart.get('error') or not chart.get('result'):
+        raise ValueError(f"Chart API error: {chart.get('error')}")
+
+    result = chart['result'][0]
+    timestamps = result.get('timestamp')
+    if not timestamps:
+        return None
+
+    intraday = interval.endswith(('m', 'h'))
+    index = pd.to_datetime(timestamps, unit='s', utc=True).tz_convert(
+        result['meta'].get('exchangeTimezoneName', 'UTC')
+    )
+    if not intraday:
+        index = index.normalize()
+    index.name = 'Datetime' if intraday else 'Date'
+
+    quote = result['indicators']['quote'][0]
+    df = pd.DataFrame(
+        {col.capitalize(): quote.get(col) for col in ('open', 'high', 'low', 'close', 'volume')},
+        index=index
+    )
+
+    adjclose = result['indicators'].get('adjclose')
+    if adjclose:
+        ratio = pd.Series(adjclose[0]['adjclose'], index=index, dtype=float) / df['Close']
+        df[['Open', 'High', 'Low', 'Close']] = df[['Open', 'High', 'Low', 'Close']].mul(ratio, axis=0)
+
+    events = result.get('events', {})
+    df['Dividends'] = 0.0
+    df['Stock Splits'] = 0.0
+    for event in events.get('dividends', {}).values():
+        ts = pd.Timestamp(event['date'], unit='s', tz='UTC').tz_convert(index.tz)
+        df.loc[df.index == (ts if intraday else ts.normalize()), 'Dividends'] = event['amount']
+    for event in events.get('splits', {}).values():
+        ts = pd.Timestamp(event['date'], unit='s', tz='UTC').tz_convert(index.tz)
+        df.loc[df.index == (ts if intraday else ts.normalize()), 'Stock Splits'] = (
+            event['numerator'] / event['denominator']
+        )
+
+    return df.dropna(subset=['Open', 'High', 'Low', 'Close'], how='all')
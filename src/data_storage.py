@@ -2,16 +2,318 @@
 Data storage module for saving and loading stock data in Parquet format.
 """
 
+import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, List, Tuple
+import threading
+from typing import Optional, List, Tuple, Dict, Iterable, Union
 import logging
 
 from .data_utils import merge_data, get_date_range_str
-from config.settings import DAILY_DIR, HOURLY_DIR, EXPORT_DIR
+from config.settings import (
+    DAILY_DIR,
+    HOURLY_DIR,
+    EXPORT_DIR,
+    MAX_WORKERS,
+    PARQUET_COMPRESSION,
+    PARQUET_COMPRESSION_LEVEL,
+    PARQUET_MEMORY_MAP,
+    PARQUET_ROW_GROUP_SIZE,
+    PRICE_DTYPE,
+    ensure_dirs
+)
 
 logger = logging.getLogger(__name__)
 
+# Local filesystem used for reads; memory-mapped unless disabled in settings
+_READ_FS = pafs.LocalFileSystem(use_mmap=PARQUET_MEMORY_MAP)
+
+# Background writer shared by all DataStorage instances; pending writes finish before exit
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='parquet-writer')
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Narrow price and volume dtypes before writing.
+
+    Prices are stored as PRICE_DTYPE (float64 unless configured otherwise) and
+    Volume as int32 when it fits.
+    Volume with missing values is left as is.
+
+    Args:
+        df: DataFrame with OHLCV data
+
+    Returns:
+        Copy of df with narrowed dtypes (the input is not modified)
+    """
+    dtypes = {
+        col: PRICE_DTYPE
+        for col in ('Open', 'High', 'Low', 'Close', 'Adj Close')
+        if col in df.columns
+    }
+
+    if 'Volume' in df.columns and pd.api.types.is_integer_dtype(df['Volume']):
+        fits = df['Volume'].max() <= np.iinfo(np.int32).max
+        dtypes['Volume'] = 'int32' if fits else 'int64'
+
+    return df.astype(dtypes) if dtypes else df.copy()
+
+
+def _write_parquet(df: pd.DataFrame, file_path: Path) -> None:
+    """Write a DataFrame with the configured Parquet compression and layout."""
+    df.to_parquet(
+        file_path,
+        engine='pyarrow',
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+        # Only Symbol repeats one value per row; the numeric columns don't benefit
+        use_dictionary=['Symbol'],
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+        data_page_size=1 << 20,
+        write_statistics=True,
+        index=True
+    )
+
+
+def _write_parquet_atomic(df: pd.DataFrame, file_path: Path, description: str) -> None:
+    """
+    Write to a temporary file and rename it over the target.
+
+    Readers see either the old file or the complete new one, never a partial write.
+    """
+    tmp_path = file_path.with_suffix('.parquet.tmp')
+    try:
+        _write_parquet(df, tmp_path)
+        os.replace(tmp_path, file_path)
+    except Exception as e:
+        logger.error(f"Failed to save {description}: {str(e)}")
+        tmp_path.unlink(missing_ok=True)
+        raise
+    logger.info(f"Saved {description}: {file_path} ({get_date_range_str(df)})")
+
+
+def _to_bound(value: str, tz) -> pd.Timestamp:
+    """Parse a date filter, localized to the index timezone if it has one."""
+    ts = pd.Timestamp(value)
+    if tz is not None and ts.tzinfo is None:
+        ts = ts.tz_localize(tz)
+    return ts
+
+
+def _slice_dates(
+    df: pd.DataFrame,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Keep rows between two dates (inclusive).
+
+    A sorted index is cut with two binary searches, which slices instead of
+    copying. Unsorted indexes fall back to boolean masks.
+    """
+    if not start_date and not end_date:
+        return df
+
+    index = df.index
+    tz = getattr(index, 'tz', None)
+
+    if index.is_monotonic_increasing:
+        lo = index.searchsorted(_to_bound(start_date, tz), side='left') if start_date else 0
+        hi = index.searchsorted(_to_bound(end_date, tz), side='right') if end_date else len(index)
+        return df.iloc[lo:hi]
+
+    if start_date:
+        df = df[df.index >= _to_bound(start_date, tz)]
+    if end_date:
+        df = df[df.index <= _to_bound(end_date, tz)]
+    return df
+
+
+def _read_table(
+    file_path: Path,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    columns: Optional[List[str]] = None
+) -> Optional[pa.Table]:
+    """
+    Read a Parquet file as an Arrow table, pushing the date filter and column projection into the scan.
+
+    The date bounds are applied to the stored DatetimeIndex column, so row groups
+    outside the range are skipped using their footer statistics.
+
+    Args:
+        file_path: Parquet file path
+        start_date: Keep rows from this date (YYYY-MM-DD)
+        end_date: Keep rows up to this date (YYYY-MM-DD)
+        columns: Columns to read (default: all)
+
+    Returns:
+        Table including the index column, or None if the data has no stored
+        index column to filter on
+    """
+    schema = pq.read_schema(file_path)
+    index_columns = (schema.pandas_metadata or {}).get('index_columns', [])
+
+    if not index_columns or not isinstance(index_columns[0], str):
+        return None
+
+    index_name = index_columns[0]
+    index_type = schema.field(index_name).type
+    tz = getattr(index_type, 'tz', None)
+
+    filt = None
+    if start_date:
+        filt = ds.field(index_name) >= pa.scalar(_to_bound(start_date, tz), type=index_type)
+    if end_date:
+        upper = ds.field(index_name) <= pa.scalar(_to_bound(end_date, tz), type=index_type)
+        filt = upper if filt is None else filt & upper
+
+    if columns is not None:
+        # Keep the index column so to_pandas() restores the DatetimeIndex
+        columns = [c for c in columns if c != index_name] + [index_name]
+
+    dataset = ds.dataset(str(file_path), format='parquet', filesystem=_READ_FS)
+    return dataset.to_table(columns=columns, filter=filt)
+
+
+def _read_parquet(
+    file_path: Path,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Read Parquet data into pandas with the filters of _read_table().
+
+    Args:
+        file_path: Parquet file path
+        start_date: Keep rows from this date (YYYY-MM-DD)
+        end_date: Keep rows up to this date (YYYY-MM-DD)
+        columns: Columns to read (default: all)
+
+    Returns:
+        DataFrame indexed like the stored data
+    """
+    table = _read_table(file_path, start_date, end_date, columns)
+
+    if table is None:
+        # No stored index column to filter on; filter after reading
+        df = pd.read_parquet(file_path, columns=columns, memory_map=PARQUET_MEMORY_MAP)
+        return _slice_dates(df, start_date, end_date)
+
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+@lru_cache(maxsize=64)
+def _read_parquet_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    columns: Optional[Tuple[str, ...]]
+) -> pd.DataFrame:
+    """
+    Memoized _read_parquet().
+
+    The file's mtime and size are part of the key, so rewriting the file
+    invalidates its entries.
+    """
+    return _read_parquet(Path(path), start_date, end_date, list(columns) if columns is not None else None)
+
+
+def _load_parquet(
+    file_path: Path,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """Load a Parquet file through the read cache."""
+    stat = file_path.stat()
+    df = _read_parquet_cached(
+        str(file_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        start_date,
+        end_date,
+        tuple(columns) if columns is not None else None
+    )
+    # Callers get their own copy: editing values in place must not change the cached frame.
+    # Copying memory is still far cheaper than decompressing and decoding the file again.
+    return df.copy()
+
+
+def _stored_index_range(file_path: Path) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """
+    Read the first and last index timestamps from Parquet footer statistics.
+
+    Args:
+        file_path: Parquet file path
+
+    Returns:
+        (min, max) timestamps, or None if the file has no usable statistics
+    """
+    parquet_file = pq.ParquetFile(file_path)
+    schema = parquet_file.schema_arrow
+    index_columns = (schema.pandas_metadata or {}).get('index_columns', [])
+    if not index_columns or not isinstance(index_columns[0], str):
+        return None
+
+    index_type = schema.field(index_columns[0]).type
+    if not pa.types.is_timestamp(index_type):
+        return None
+
+    metadata = parquet_file.metadata
+    column = schema.get_field_index(index_columns[0])
+    lows, highs = [], []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        lows.append(pd.Timestamp(stats.min))
+        highs.append(pd.Timestamp(stats.max))
+
+    if not lows:
+        return None
+
+    start, end = min(lows), max(highs)
+    if index_type.tz is not None:
+        # Statistics of tz-aware columns are reported in UTC
+        start, end = start.tz_convert(index_type.tz), end.tz_convert(index_type.tz)
+    return start, end
+
+
+def _format_dates(column: pa.ChunkedArray, index: pd.Index) -> pa.ChunkedArray:
+    """
+    Render a timestamp column the way DataFrame.to_csv prints it, inside Arrow.
+
+    Naive midnight-only dates become 'YYYY-MM-DD'; other timestamps are written
+    to the second, with a '+HH:MM' offset when timezone-aware.
+    """
+    if not pa.types.is_timestamp(column.type):
+        return column
+
+    tz = column.type.tz
+    column = column.cast(pa.timestamp('s', tz=tz), safe=False)
+    if tz is None:
+        date_only = bool((index == index.normalize()).all())
+        return pc.strftime(column, format='%Y-%m-%d' if date_only else '%Y-%m-%d %H:%M:%S')
+
+    text = pc.strftime(column, format='%Y-%m-%d %H:%M:%S')
+    # Arrow prints the offset as -0500; pandas uses -05:00
+    offset = pc.replace_substring_regex(pc.strftime(column, format='%z'), pattern=r'(\d\d)$', replacement=r':\1')
+    return pc.binary_join_element_wise(text, offset, '')
+
 
 class DataStorage:
     """Manage stock data persistence using Parquet format."""
@@ -26,15 +328,78 @@ class DataStorage:
         """
         self.daily_dir = Path(daily_dir)
         self.hourly_dir = Path(hourly_dir)
+        # Background writes not yet known to have succeeded, by file path
+        self._pending: Dict[Path, Future] = {}
+        self._pending_lock = threading.Lock()
+
+    def _submit_write(self, df: pd.DataFrame, file_path: Path, description: str) -> None:
+        """Queue an atomic write of df to file_path on the background writer."""
+        # Snapshot on the calling thread so later edits to df cannot leak into the write
+        df = _downcast(df)
+        future = _WRITE_EXECUTOR.submit(_write_parquet_atomic, df, file_path, description)
+        with self._pending_lock:
+            self._pending[file_path] = future
+        future.add_done_callback(partial(self._forget_write, file_path))
+
+    def _forget_write(self, file_path: Path, future: Future) -> None:
+        # Failed writes stay pending so the next wait on them raises
+        if future.exception() is None:
+            with self._pending_lock:
+                if self._pending.get(file_path) is future:
+                    del self._pending[file_path]
+
+    @staticmethod
+    def _read_existing(file_path: Path, description: str) -> Optional[pd.DataFrame]:
+        """
+        Read stored data for a merge, bypassing the read cache.
 
-        # Ensure directories exist
-        self.daily_dir.mkdir(parents=True, exist_ok=True)
-        self.hourly_dir.mkdir(parents=True, exist_ok=True)
+        The file is about to be rewritten, which would leave a cached copy of
+        the full history unreachable until it is evicted.
+        """
+        try:
+            return _read_parquet(file_path)
+        except Exception as e:
+            logger.error(f"Failed to load {description}: {str(e)}")
+            return None
+
+    def _wait(self, file_path: Path) -> None:
+        """Block until any pending write to file_path has finished."""
+        with self._pending_lock:
+            future = self._pending.get(file_path)
+        if future is None:
+            return
+        try:
+            future.result()
+        finally:
+            with self._pending_lock:
+                if self._pending.get(file_path) is future:
+                    del self._pending[file_path]
+
+    def flush(self) -> None:
+        """
+        Wait for all pending background writes.
+
+        Raises:
+            Exception: The first error raised by a failed write
+        """
+        with self._pending_lock:
+            paths = list(self._pending)
+        errors = []
+        for file_path in paths:
+            try:
+                self._wait(file_path)
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
 
     def save_daily(self, symbol: str, df: pd.DataFrame, merge: bool = True) -> None:
         """
         Save daily data to Parquet file.
 
+        The file is written in the background; call flush() to wait for it.
+        Loads of the same symbol wait for the write automatically.
+
         Args:
             symbol: Stock ticker symbol
             df: DataFrame with OHLCV data
@@ -45,16 +410,17 @@ class DataStorage:
             return
 
         file_path = self.daily_dir / f"{symbol.upper()}.parquet"
+        self._wait(file_path)
 
         # Merge with existing data if requested
         if merge and file_path.exists():
-            existing_df = self.load_daily(symbol)
+            existing_df = self._read_existing(file_path, f"daily data for {symbol}")
             df = merge_data(existing_df, df)
             logger.info(f"Merged with existing data for {symbol}")
 
         # Save to parquet
-        df.to_parquet(file_path, compression='snappy', index=True)
-        logger.info(f"Saved daily data for {symbol}: {file_path} ({get_date_range_str(df)})")
+        ensure_dirs(self.daily_dir)
+        self._submit_write(df, file_path, f"daily data for {symbol}")
 
     def save_hourly(
         self,
@@ -66,6 +432,8 @@ class DataStorage:
         """
         Save hourly/intraday data to Parquet file.
 
+        The file is written in the background; call flush() to wait for it.
+
         Args:
             symbol: Stock ticker symbol
             df: DataFrame with OHLCV data
@@ -78,22 +446,71 @@ class DataStorage:
 
         # Include interval in filename for different granularities
         file_path = self.hourly_dir / f"{symbol.upper()}_{interval}.parquet"
+        self._wait(file_path)
 
         # Merge with existing data if requested
         if merge and file_path.exists():
-            existing_df = self.load_hourly(symbol, interval)
+            existing_df = self._read_existing(file_path, f"hourly data for {symbol} ({interval})")
             df = merge_data(existing_df, df)
             logger.info(f"Merged with existing data for {symbol} ({interval})")
 
         # Save to parquet
-        df.to_parquet(file_path, compression='snappy', index=True)
-        logger.info(f"Saved hourly data for {symbol} ({interval}): {file_path} ({get_date_range_str(df)})")
+        ensure_dirs(self.hourly_dir)
+        self._submit_write(df, file_path, f"hourly data for {symbol} ({interval})")
+
+    def save_many(
+        self,
+        frames: Union[Mapping[str, pd.DataFrame], Iterable[Tuple[str, pd.DataFrame]]],
+        data_type: str = 'daily',
+        interval: str = '1h',
+        merge: bool = True
+    ) -> Dict[str, int]:
+        """
+        Save several symbols, writing their Parquet files in parallel.
+
+        Frames are submitted as soon as they arrive, so an iterator such as
+        StockDataFetcher.download_daily_iter() is written while it downloads.
+
+        Args:
+            frames: Mapping of symbol to DataFrame, or iterable of (symbol, DataFrame) pairs
+            data_type: 'daily' or 'hourly'
+            interval: Data interval for hourly data (1h, 30m, etc.)
+            merge: If True, merge with existing data
+
+        Returns:
+            Dictionary mapping symbol to number of records saved
+        """
+        if data_type == 'daily':
+            save = self.save_daily
+        elif data_type == 'hourly':
+            save = partial(self.save_hourly, interval=interval)
+        else:
+            raise ValueError(f"Invalid data_type: {data_type}")
+
+        if isinstance(frames, Mapping):
+            frames = frames.items()
+
+        record_counts = {}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = []
+            for symbol, df in frames:
+                futures.append(executor.submit(save, symbol, df, merge=merge))
+                record_counts[symbol] = 0 if df is None else len(df)
+
+            # Surface the first merge error, if any
+            for future in futures:
+                future.result()
+
+        # Wait for the background writes so the files are on disk on return
+        self.flush()
+        return record_counts
 
     def load_daily(
         self,
         symbol: str,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        columns: Optional[List[str]] = None
     ) -> Optional[pd.DataFrame]:
         """
         Load daily data from Parquet file.
@@ -102,24 +519,20 @@ class DataStorage:
             symbol: Stock ticker symbol
             start_date: Filter from this date (YYYY-MM-DD)
             end_date: Filter to this date (YYYY-MM-DD)
+            columns: Columns to load (default: all)
 
         Returns:
             DataFrame or None if file doesn't exist
         """
         file_path = self.daily_dir / f"{symbol.upper()}.parquet"
+        self._wait(file_path)
 
         if not file_path.exists():
             logger.warning(f"No daily data found for {symbol}: {file_path}")
             return None
 
         try:
-            df = pd.read_parquet(file_path)
-
-            # Apply date filtering
-            if start_date:
-                df = df[df.index >= pd.to_datetime(start_date)]
-            if end_date:
-                df = df[df.index <= pd.to_datetime(end_date)]
+            df = _load_parquet(file_path, start_date, end_date, columns)
 
             logger.info(f"Loaded daily data for {symbol}: {get_date_range_str(df)}")
             return df
@@ -128,12 +541,85 @@ class DataStorage:
             logger.error(f"Failed to load daily data for {symbol}: {str(e)}")
             return None
 
+    def load_daily_arrow(
+        self,
+        symbol: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> Optional[pa.Table]:
+        """
+        Load daily data as a pyarrow Table, skipping the pandas conversion.
+
+        For Arrow-native consumers (pyarrow.compute, Polars, DuckDB). The date
+        index is kept as a regular column, and Table.to_pandas() restores it as
+        the index.
+
+        Args:
+            symbol: Stock ticker symbol
+            start_date: Filter from this date (YYYY-MM-DD)
+            end_date: Filter to this date (YYYY-MM-DD)
+            columns: Columns to load (default: all)
+
+        Returns:
+            Table or None if no data exists
+        """
+        file_path = self.daily_dir / f"{symbol.upper()}.parquet"
+        self._wait(file_path)
+
+        if not file_path.exists():
+            logger.warning(f"No daily data found for {symbol}: {file_path}")
+            return None
+
+        try:
+            table = _read_table(file_path, start_date, end_date, columns)
+            if table is None:
+                df = _read_parquet(file_path, start_date, end_date, columns)
+                table = pa.Table.from_pandas(df, preserve_index=True)
+
+            logger.info(f"Loaded daily data for {symbol}: {table.num_rows} records")
+            return table
+
+        except Exception as e:
+            logger.error(f"Failed to load daily data for {symbol}: {str(e)}")
+            return None
+
+    def load_many_daily(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Load daily data for several symbols in parallel.
+
+        Parquet decoding runs in pyarrow without holding the GIL, so files
+        are read concurrently on a thread pool.
+
+        Args:
+            symbols: List of stock ticker symbols
+            start_date: Filter from this date (YYYY-MM-DD)
+            end_date: Filter to this date (YYYY-MM-DD)
+            columns: Columns to load (default: all)
+            max_workers: Number of loader threads (default: MAX_WORKERS)
+
+        Returns:
+            Dictionary mapping symbol to DataFrame (symbols without data are omitted)
+        """
+        load = partial(self.load_daily, start_date=start_date, end_date=end_date, columns=columns)
+        with ThreadPoolExecutor(max_workers=max_workers or MAX_WORKERS) as executor:
+            frames = executor.map(load, symbols)
+            return {symbol: df for symbol, df in zip(symbols, frames) if df is not None}
+
     def load_hourly(
         self,
         symbol: str,
         interval: str = '1h',
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        columns: Optional[List[str]] = None
     ) -> Optional[pd.DataFrame]:
         """
         Load hourly/intraday data from Parquet file.
@@ -143,24 +629,20 @@ class DataStorage:
             interval: Data interval (1h, 30m, etc.)
             start_date: Filter from this date (YYYY-MM-DD)
             end_date: Filter to this date (YYYY-MM-DD)
+            columns: Columns to load (default: all)
 
         Returns:
             DataFrame or None if file doesn't exist
         """
         file_path = self.hourly_dir / f"{symbol.upper()}_{interval}.parquet"
+        self._wait(file_path)
 
         if not file_path.exists():
             logger.warning(f"No hourly data found for {symbol} ({interval}): {file_path}")
             return None
 
         try:
-            df = pd.read_parquet(file_path)
-
-            # Apply date filtering
-            if start_date:
-                df = df[df.index >= pd.to_datetime(start_date)]
-            if end_date:
-                df = df[df.index <= pd.to_datetime(end_date)]
+            df = _load_parquet(file_path, start_date, end_date, columns)
 
             logger.info(f"Loaded hourly data for {symbol} ({interval}): {get_date_range_str(df)}")
             return df
@@ -188,6 +670,7 @@ class DataStorage:
         else:
             raise ValueError(f"Invalid data_type: {data_type}. Use 'daily' or 'hourly'")
 
+        self.flush()
         files = list(directory.glob(pattern))
 
         if data_type == 'daily':
@@ -198,31 +681,47 @@ class DataStorage:
 
         return sorted(symbols)
 
-    def get_date_range(self, symbol: str, data_type: str = 'daily') -> Optional[Tuple[str, str]]:
+    def get_date_range(
+        self,
+        symbol: str,
+        data_type: str = 'daily',
+        interval: str = '1h'
+    ) -> Optional[Tuple[str, str]]:
         """
         Get date range for a symbol's data.
 
+        Only the Parquet footer is read, so this is cheap for any file size.
+
         Args:
             symbol: Stock ticker symbol
             data_type: 'daily' or 'hourly'
+            interval: Data interval for hourly data (1h, 30m, etc.)
 
         Returns:
             Tuple of (start_date, end_date) as strings or None
         """
         if data_type == 'daily':
-            df = self.load_daily(symbol)
+            file_path = self.daily_dir / f"{symbol.upper()}.parquet"
+            load = self.load_daily
         elif data_type == 'hourly':
-            df = self.load_hourly(symbol)
+            file_path = self.hourly_dir / f"{symbol.upper()}_{interval}.parquet"
+            load = partial(self.load_hourly, interval=interval)
         else:
             raise ValueError(f"Invalid data_type: {data_type}")
 
-        if df is None or df.empty:
-            return None
+        self._wait(file_path)
 
-        start = df.index.min().strftime('%Y-%m-%d')
-        end = df.index.max().strftime('%Y-%m-%d')
+        # Footer statistics answer this without decoding any data
+        index_range = _stored_index_range(file_path) if file_path.exists() else None
+        if index_range is not None:
+            start, end = index_range
+        else:
+            df = load(symbol)
+            if df is None or df.empty:
+                return None
+            start, end = df.index.min(), df.index.max()
 
-        return (start, end)
+        return (start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
 
     def delete_data(self, symbol: str, data_type: str = 'daily') -> bool:
         """
@@ -235,6 +734,9 @@ class DataStorage:
         Returns:
             True if deleted, False if file didn't exist
         """
+        # Don't let a queued write recreate the file after it is deleted
+        self.flush()
+
         if data_type == 'daily':
             file_path = self.daily_dir / f"{symbol.upper()}.parquet"
         elif data_type == 'hourly':
@@ -279,7 +781,7 @@ class DataStorage:
             output_dir = EXPORT_DIR
 
         output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dirs(output_dir)
 
         # Load data
         if data_type == 'daily':
@@ -295,8 +797,22 @@ class DataStorage:
             logger.error(f"No data to export for {symbol}")
             return None
 
-        # Export to CSV
-        df.to_csv(output_file)
+        # Export to CSV with pyarrow's native writer, keeping the date column first.
+        # Dates are rendered as pandas prints them and the header is written
+        # unquoted so the file matches DataFrame.to_csv output
+        table = pa.Table.from_pandas(df.reset_index(), preserve_index=False)
+        table = table.set_column(0, table.column_names[0], _format_dates(table.column(0), df.index))
+        try:
+            with open(output_file, 'wb') as f:
+                f.write((','.join(table.column_names) + '\n').encode())
+                pacsv.write_csv(
+                    table,
+                    f,
+                    write_options=pacsv.WriteOptions(include_header=False, quoting_style='none')
+                )
+        except pa.ArrowInvalid:
+            # A string value contains a comma, quote or newline; let pandas quote it
+            df.to_csv(output_file)
         logger.info(f"Exported {symbol} to {output_file}")
 
         return output_file
@@ -318,5 +834,14 @@ class DataStorage:
         else:
             raise ValueError(f"Invalid data_type: {data_type}")
 
-        total_size = sum(f.stat().st_size for f in directory.glob('*.parquet'))
+        self.flush()
+        if not directory.is_dir():
+            return 0.0
+
+        with os.scandir(directory) as entries:
+            total_size = sum(
+                entry.stat().st_size
+                for entry in entries
+                if entry.name.endswith('.parquet') and entry.is_file()
+            )
         return total_size / (1024 * 1024)  # Convert to MB
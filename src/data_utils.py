@@ -3,13 +3,32 @@ Utility functions for data validation and formatting.
 """
 
 import re
-from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 import logging
 
+from config.settings import MAX_PRICE_CHANGE_PCT
+
 logger = logging.getLogger(__name__)
 
+# Standard OHLCV column names, keyed by lowercase variant
+COLUMN_MAPPING = {
+    'open': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'close': 'Close',
+    'volume': 'Volume',
+    'adj close': 'Adj Close',
+    'adjclose': 'Adj Close',
+}
+
+# Stock symbols are typically 1-5 uppercase letters
+# Some may have dots (e.g., BRK.A) or hyphens
+_SYMBOL_RE = re.compile(r'^[A-Z]{1,5}(\.[A-Z])?(-[A-Z])?$')
+
 
 def validate_symbol(symbol: str) -> bool:
     """
@@ -24,10 +43,26 @@ def validate_symbol(symbol: str) -> bool:
     if not symbol or not isinstance(symbol, str):
         return False
 
-    # Stock symbols are typically 1-5 uppercase letters
-    # Some may have dots (e.g., BRK.A) or hyphens
-    pattern = r'^[A-Z]{1,5}(\.[A-Z])?(-[A-Z])?$'
-    return bool(re.match(pattern, symbol.upper()))
+    return _match_symbol(symbol)
+
+
+@lru_cache(maxsize=4096)
+def _match_symbol(symbol: str) -> bool:
+    """Memoized pattern check behind validate_symbol and validate_symbols."""
+    return bool(_SYMBOL_RE.match(symbol.upper()))
+
+
+def validate_symbols(symbols: Iterable[str]) -> List[bool]:
+    """
+    Validate many stock symbols at once.
+
+    Args:
+        symbols: Stock ticker symbols
+
+    Returns:
+        List of booleans, True where the symbol is valid
+    """
+    return [isinstance(s, str) and _match_symbol(s) for s in symbols]
 
 
 def validate_date_range(
@@ -75,6 +110,20 @@ def validate_date_range(
     return start_dt, end_dt
 
 
+def standardize_column(name: str) -> str:
+    """
+    Map a raw column name to its standard OHLCV spelling.
+
+    Args:
+        name: Column name from the data source
+
+    Returns:
+        Standardized name, or the stripped original if it isn't an OHLCV column
+    """
+    name = name.strip()
+    return COLUMN_MAPPING.get(name.lower(), name)
+
+
 def format_dataframe(df: pd.DataFrame, symbol: str = None) -> pd.DataFrame:
     """
     Standardize DataFrame column names and format.
@@ -89,22 +138,11 @@ def format_dataframe(df: pd.DataFrame, symbol: str = None) -> pd.DataFrame:
     if df is None or df.empty:
         return df
 
-    # Make a copy to avoid modifying original
-    df = df.copy()
+    # Shallow copy: the original keeps its labels, the data blocks are shared
+    df = df.copy(deep=False)
 
     # Standardize column names (handle case variations)
-    column_mapping = {
-        'open': 'Open',
-        'high': 'High',
-        'low': 'Low',
-        'close': 'Close',
-        'volume': 'Volume',
-        'adj close': 'Adj Close',
-        'adjclose': 'Adj Close',
-    }
-
-    df.columns = [col.strip() for col in df.columns]
-    df.rename(columns={col: column_mapping.get(col.lower(), col) for col in df.columns}, inplace=True)
+    df.columns = [standardize_column(col) for col in df.columns]
 
     # Ensure datetime index
     if not isinstance(df.index, pd.DatetimeIndex):
@@ -117,11 +155,13 @@ def format_dataframe(df: pd.DataFrame, symbol: str = None) -> pd.DataFrame:
     if symbol:
         df['Symbol'] = symbol
 
-    # Sort by date
-    df.sort_index(inplace=True)
+    # Sort by date (yfinance data usually arrives sorted and unique, so this is often a no-op)
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
 
     # Remove duplicates
-    df = df[~df.index.duplicated(keep='last')]
+    if not df.index.is_unique:
+        df = df[~df.index.duplicated(keep='last')]
 
     return df
 
@@ -143,7 +183,15 @@ def merge_data(old_df: pd.DataFrame, new_df: pd.DataFrame) -> pd.DataFrame:
     if new_df is None or new_df.empty:
         return old_df
 
-    # Concatenate
+    head = None
+    if old_df.index.is_monotonic_increasing and old_df.index.is_unique:
+        # Stored data is already sorted and unique, and new rows usually start near
+        # its end: keep the untouched head as is and only merge the overlapping tail
+        cut = old_df.index.searchsorted(new_df.index.min())
+        if cut > 0:
+            head, old_df = old_df.iloc[:cut], old_df.iloc[cut:]
+
+    # Concatenate (the tail may be empty; new_df still needs deduping and sorting)
     merged = pd.concat([old_df, new_df])
 
     # Remove duplicates (keep last)
@@ -152,6 +200,9 @@ def merge_data(old_df: pd.DataFrame, new_df: pd.DataFrame) -> pd.DataFrame:
     # Sort by date
     merged.sort_index(inplace=True)
 
+    if head is not None:
+        merged = pd.concat([head, merged])
+
     return merged
 
 
@@ -201,29 +252,39 @@ def validate_price_data(df: pd.DataFrame, symbol: str = None) -> pd.DataFrame:
 
     symbol_str = f" for {symbol}" if symbol else ""
 
-    # Check for null values
-    null_count = df.isnull().sum().sum()
+    # Check for null values one column at a time: isnan for plain float columns,
+    # isna for the rest (e.g. Symbol). Integer columns cannot hold NaN
+    null_count = 0
+    for col, dtype in df.dtypes.items():
+        if isinstance(dtype, np.dtype) and dtype.kind in 'iub':
+            continue
+        if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+            null_count += int(np.isnan(df[col].to_numpy()).sum())
+        else:
+            null_count += int(df[col].isna().sum())
     if null_count > 0:
         logger.warning(f"Found {null_count} null values{symbol_str}")
 
-    # Check for negative prices
-    price_cols = ['Open', 'High', 'Low', 'Close']
-    for col in price_cols:
-        if col in df.columns:
-            negative = df[df[col] < 0]
-            if len(negative) > 0:
-                logger.error(f"Found {len(negative)} negative {col} prices{symbol_str}")
+    # Check for negative prices (one pass over all price columns)
+    price_cols = [col for col in ('Open', 'High', 'Low', 'Close') if col in df.columns]
+    if price_cols:
+        negative_counts = (df[price_cols].to_numpy(dtype=float) < 0).sum(axis=0)
+        for col, count in zip(price_cols, negative_counts):
+            if count > 0:
+                logger.error(f"Found {count} negative {col} prices{symbol_str}")
 
-    # Check for extreme price changes
+    # Check for extreme price changes (vectorized, without adding a temporary column)
     if 'Close' in df.columns:
-        df['Price_Change_Pct'] = df['Close'].pct_change() * 100
-        extreme = df[abs(df['Price_Change_Pct']) > 50]  # More than 50% change
-        if len(extreme) > 0:
+        close = df['Close'].to_numpy(dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change_pct = np.abs(np.diff(close) / close[:-1]) * 100
+        # diff() drops the first row, so shift positions back onto df's index
+        extreme_idx = np.flatnonzero(change_pct > MAX_PRICE_CHANGE_PCT) + 1
+        if len(extreme_idx) > 0:
             logger.warning(
-                f"Found {len(extreme)} extreme price changes (>50%){symbol_str}: "
-                f"{extreme.index.tolist()}"
+                f"Found {len(extreme_idx)} extreme price changes (>{MAX_PRICE_CHANGE_PCT}%){symbol_str}: "
+                f"{df.index[extreme_idx].tolist()}"
             )
-        df.drop('Price_Change_Pct', axis=1, inplace=True)
 
     return df
 
@@ -0,0 +1,88 @@
+"""
+Logging helpers shared by the command-line scripts.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+from config.settings import LOG_BUFFER_SIZE, LOG_DIR, LOG_FORMAT, LOG_LEVEL_NUM, ensure_dirs
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that opens its file lazily and batches writes.
+
+    The file is only opened when the first record is emitted, and records
+    are written through a large buffer instead of being flushed one by one.
+    ERROR records are flushed immediately, and everything else is written
+    when the buffer fills or the handler is closed at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        mode: str = 'a',
+        encoding: Optional[str] = None,
+        buffer_size: int = LOG_BUFFER_SIZE
+    ):
+        """
+        Initialize the handler.
+
+        Args:
+            filename: Log file path
+            mode: File open mode
+            encoding: File encoding (default: platform default)
+            buffer_size: Write buffer size in bytes
+        """
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode=mode, encoding=encoding, delay=True)
+        self.terminator = '\n'
+
+    def _open(self):
+        # Runs on the first emitted record, so runs that log nothing never touch the log directory
+        ensure_dirs(Path(self.baseFilename).parent)
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+
+    def flush(self):
+        # StreamHandler.emit() calls this after every record; leave batching to the buffer
+        pass
+
+    def emit(self, record: logging.LogRecord):
+        super().emit(record)
+        if record.levelno >= logging.ERROR and self.stream is not None:
+            self.stream.flush()
+
+
+def configure(script_name: str, level: Optional[int] = None) -> None:
+    """
+    Attach the console and log file handlers to the root logger.
+
+    Scripts call this from main() once their arguments have parsed, so
+    importing a script or asking for --help sets up no logging at all.
+    Repeated calls are ignored.
+
+    Args:
+        script_name: Log file name without extension (usually the script stem)
+        level: Logging level (default: LOG_LEVEL from settings)
+    """
+    if configure._done:
+        return
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    root = logging.getLogger()
+    for handler in (logging.StreamHandler(), BufferedFileHandler(LOG_DIR / f"{script_name}.log")):
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+    root.setLevel(LOG_LEVEL_NUM if level is None else level)
+
+    configure._done = True
+
+
+configure._done = False
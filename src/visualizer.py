@@ -2,17 +2,120 @@
 Visualization utilities for stock data.
 """
 
+import os
+import sys
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import matplotlib
+
+# Headless batch runs (no display, no notebook, no explicit MPLBACKEND) skip GUI backend probing
+if (
+    sys.platform.startswith('linux')
+    and not os.environ.get('DISPLAY')
+    and not os.environ.get('WAYLAND_DISPLAY')
+    and 'MPLBACKEND' not in os.environ
+    and 'ipykernel' not in sys.modules
+):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import seaborn as sns
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Optional, Tuple, Union
 import mplfinance as mpf
 
 # Set style
 sns.set_style('whitegrid')
 plt.rcParams['figure.figsize'] = (14, 7)
 
+# Series longer than this are rasterized so saved vector figures stay small
+RASTERIZE_POINTS = 100_000
+
+# Figures kept for reuse when enabled with set_figure_reuse(), keyed by (figsize, rows)
+_FIG_POOL: Dict[Tuple, plt.Figure] = {}
+_reuse_figures = False
+
+
+def set_figure_reuse(enabled: bool = True) -> None:
+    """
+    Reuse one figure per size across plot calls instead of creating new ones.
+
+    Useful when rendering many plots in a loop. A reused figure is cleared by
+    the next plot call of the same size, so save or show each figure before
+    plotting the next one.
+
+    Args:
+        enabled: Turn figure reuse on or off (off also drops pooled figures)
+    """
+    global _reuse_figures
+    _reuse_figures = enabled
+    if not enabled:
+        _FIG_POOL.clear()
+
+
+def _column_series(data: Union[pd.DataFrame, pa.Table], column: str) -> Optional[pd.Series]:
+    """
+    Get one date-indexed column from a DataFrame or an Arrow table.
+
+    Arrow tables (e.g. from DataStorage.load_daily_arrow) are converted to
+    pandas one column at a time, so unused columns are never materialized.
+
+    Returns:
+        Series, or None if the column is missing
+    """
+    if isinstance(data, pd.DataFrame):
+        return data[column] if column in data.columns else None
+
+    if column not in data.column_names:
+        return None
+    index_columns = [c for c in (data.schema.pandas_metadata or {}).get('index_columns', []) if isinstance(c, str)]
+    return data.select(index_columns + [column]).to_pandas(split_blocks=True)[column]
+
+
+def _subplots(figsize: Tuple[int, int], nrows: int = 1, **kwargs):
+    """plt.subplots() for a single column of axes, reusing a pooled figure when enabled."""
+    if not _reuse_figures:
+        return plt.subplots(nrows, 1, figsize=figsize, **kwargs)
+
+    key = (tuple(figsize), nrows)
+    fig = _FIG_POOL.get(key)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig, axes = plt.subplots(nrows, 1, figsize=figsize, **kwargs)
+        _FIG_POOL[key] = fig
+        return fig, axes
+
+    fig.clf()
+    return fig, fig.subplots(nrows, 1, **kwargs)
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing moving average from one cumulative sum.
+
+    Matches Series.rolling(window).mean(): NaN until the window is full and
+    wherever the window contains a NaN.
+
+    Args:
+        values: 1-D float array
+        window: Number of points per average
+
+    Returns:
+        Array the same length as values
+    """
+    out = np.full(len(values), np.nan)
+    if window <= 0 or len(values) < window:
+        return out
+
+    missing = np.isnan(values)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, values))))
+    nan_count = np.concatenate(([0], np.cumsum(missing)))
+
+    sums = csum[window:] - csum[:-window]
+    has_nan = (nan_count[window:] - nan_count[:-window]) > 0
+    out[window - 1:] = np.where(has_nan, np.nan, sums / window)
+    return out
+
 
 def plot_price_history(
     df: pd.DataFrame,
@@ -34,10 +137,10 @@ def plot_price_history(
     Returns:
         Matplotlib figure object
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _subplots(figsize)
 
     # Plot data
-    ax.plot(df.index, df[column], linewidth=2, label=column)
+    ax.plot(df.index, df[column], linewidth=2, label=column, rasterized=len(df) > RASTERIZE_POINTS)
 
     # Labels and title
     if title is None:
@@ -48,13 +151,13 @@ def plot_price_history(
 
     # Format x-axis
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.xticks(rotation=45)
+    ax.tick_params(axis='x', labelrotation=45)
 
     # Grid and legend
     ax.grid(True, alpha=0.3)
     ax.legend()
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -109,12 +212,11 @@ def plot_volume(
     Returns:
         Matplotlib figure object
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _subplots(figsize)
 
     # Plot volume bars
-    colors = ['green' if df['Close'].iloc[i] >= df['Open'].iloc[i] else 'red'
-              for i in range(len(df))]
-    ax.bar(df.index, df['Volume'], color=colors, alpha=0.6)
+    colors = np.where(df['Close'].to_numpy() >= df['Open'].to_numpy(), 'green', 'red')
+    ax.bar(df.index, df['Volume'], color=colors, alpha=0.6, rasterized=len(df) > RASTERIZE_POINTS)
 
     # Labels and title
     title = f"{symbol} - Trading Volume" if symbol else "Trading Volume"
@@ -127,14 +229,14 @@ def plot_volume(
 
     # Format x-axis
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.xticks(rotation=45)
+    ax.tick_params(axis='x', labelrotation=45)
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
 def plot_multiple_symbols(
-    data_dict: Dict[str, pd.DataFrame],
+    data_dict: Dict[str, Union[pd.DataFrame, pa.Table]],
     column: str = 'Close',
     normalize: bool = True,
     figsize: Tuple[int, int] = (14, 7)
@@ -143,7 +245,7 @@ def plot_multiple_symbols(
     Plot multiple symbols on same chart for comparison.
 
     Args:
-        data_dict: Dictionary mapping symbol to DataFrame
+        data_dict: Dictionary mapping symbol to DataFrame or pyarrow Table
         column: Column to plot (default: Close)
         normalize: Normalize to 100 at start for comparison
         figsize: Figure size tuple
@@ -151,19 +253,18 @@ def plot_multiple_symbols(
     Returns:
         Matplotlib figure object
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _subplots(figsize)
 
-    for symbol, df in data_dict.items():
-        if column not in df.columns:
+    for symbol, data in data_dict.items():
+        prices = _column_series(data, column)
+        if prices is None:
             continue
 
-        prices = df[column]
-
         if normalize:
             # Normalize to 100 at start
             prices = (prices / prices.iloc[0]) * 100
 
-        ax.plot(df.index, prices, linewidth=2, label=symbol, alpha=0.8)
+        ax.plot(prices.index, prices, linewidth=2, label=symbol, alpha=0.8, rasterized=len(prices) > RASTERIZE_POINTS)
 
     # Labels and title
     ylabel = 'Normalized Price (Start = 100)' if normalize else f'{column} Price ($)'
@@ -175,13 +276,13 @@ def plot_multiple_symbols(
 
     # Format x-axis
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.xticks(rotation=45)
+    ax.tick_params(axis='x', labelrotation=45)
 
     # Grid and legend
     ax.grid(True, alpha=0.3)
     ax.legend(loc='best')
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -203,20 +304,24 @@ def plot_returns(
     Returns:
         Matplotlib figure object
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _subplots(figsize)
 
-    # Calculate returns
-    returns = df['Close'].pct_change()
+    rasterized = len(df) > RASTERIZE_POINTS
 
     if cumulative:
-        # Cumulative returns
-        cum_returns = (1 + returns).cumprod() - 1
-        ax.plot(df.index, cum_returns * 100, linewidth=2, color='blue')
+        # Cumulative returns, compounded in log space in one pass
+        close = df['Close'].ffill().to_numpy(dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_returns = np.diff(np.log(close), prepend=np.nan)
+        cum_returns = np.expm1(np.nancumsum(log_returns))
+        cum_returns[np.isnan(log_returns)] = np.nan
+        ax.plot(df.index, cum_returns * 100, linewidth=2, color='blue', rasterized=rasterized)
         ylabel = 'Cumulative Return (%)'
         title_suffix = 'Cumulative Returns'
     else:
         # Daily returns
-        ax.plot(df.index, returns * 100, linewidth=1, color='blue', alpha=0.6)
+        returns = df['Close'].pct_change()
+        ax.plot(df.index, returns * 100, linewidth=1, color='blue', alpha=0.6, rasterized=rasterized)
         ylabel = 'Daily Return (%)'
         title_suffix = 'Daily Returns'
 
@@ -231,12 +336,12 @@ def plot_returns(
 
     # Format x-axis
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.xticks(rotation=45)
+    ax.tick_params(axis='x', labelrotation=45)
 
     # Grid
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -258,17 +363,19 @@ def plot_moving_averages(
     Returns:
         Matplotlib figure object
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _subplots(figsize)
 
     # Plot close price
-    ax.plot(df.index, df['Close'], linewidth=2, label='Close', alpha=0.8)
+    rasterized = len(df) > RASTERIZE_POINTS
+    ax.plot(df.index, df['Close'], linewidth=2, label='Close', alpha=0.8, rasterized=rasterized)
 
     # Plot moving averages
+    close = df['Close'].to_numpy(dtype=np.float64)
     colors = ['orange', 'green', 'red']
     for i, period in enumerate(periods):
-        ma = df['Close'].rolling(window=period).mean()
+        ma = _rolling_mean(close, period)
         color = colors[i % len(colors)]
-        ax.plot(df.index, ma, linewidth=2, label=f'MA{period}', alpha=0.7, color=color)
+        ax.plot(df.index, ma, linewidth=2, label=f'MA{period}', alpha=0.7, color=color, rasterized=rasterized)
 
     # Labels and title
     title = f"{symbol} - Moving Averages" if symbol else "Moving Averages"
@@ -278,18 +385,18 @@ def plot_moving_averages(
 
     # Format x-axis
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.xticks(rotation=45)
+    ax.tick_params(axis='x', labelrotation=45)
 
     # Grid and legend
     ax.grid(True, alpha=0.3)
     ax.legend(loc='best')
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
 def plot_correlation_matrix(
-    data_dict: Dict[str, pd.DataFrame],
+    data_dict: Dict[str, Union[pd.DataFrame, pa.Table]],
     column: str = 'Close',
     figsize: Tuple[int, int] = (10, 8)
 ) -> plt.Figure:
@@ -297,24 +404,23 @@ def plot_correlation_matrix(
     Plot correlation matrix heatmap for multiple symbols.
 
     Args:
-        data_dict: Dictionary mapping symbol to DataFrame
+        data_dict: Dictionary mapping symbol to DataFrame or pyarrow Table
         column: Column to use for correlation (default: Close)
         figsize: Figure size tuple
 
     Returns:
         Matplotlib figure object
     """
-    # Create DataFrame with all symbols
-    combined = pd.DataFrame()
-    for symbol, df in data_dict.items():
-        if column in df.columns:
-            combined[symbol] = df[column]
+    # Create DataFrame with all symbols, aligning their indexes in one pass
+    series = {symbol: _column_series(data, column) for symbol, data in data_dict.items()}
+    series = {symbol: values for symbol, values in series.items() if values is not None}
+    combined = pd.concat(series, axis=1, join='outer', copy=False) if series else pd.DataFrame()
 
     # Calculate correlation
     corr = combined.corr()
 
     # Plot heatmap
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _subplots(figsize)
     sns.heatmap(
         corr,
         annot=True,
@@ -329,7 +435,7 @@ def plot_correlation_matrix(
 
     ax.set_title(f'Stock Price Correlation Matrix ({column})', fontsize=16, fontweight='bold')
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -349,10 +455,11 @@ def plot_price_and_volume(
     Returns:
         Matplotlib figure object
     """
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize, sharex=True, gridspec_kw={'height_ratios': [3, 1]})
+    fig, (ax1, ax2) = _subplots(figsize, 2, sharex=True, gridspec_kw={'height_ratios': [3, 1]})
 
     # Plot price
-    ax1.plot(df.index, df['Close'], linewidth=2, color='blue', label='Close')
+    rasterized = len(df) > RASTERIZE_POINTS
+    ax1.plot(df.index, df['Close'], linewidth=2, color='blue', label='Close', rasterized=rasterized)
     title = f"{symbol} - Price and Volume" if symbol else "Price and Volume"
     ax1.set_title(title, fontsize=16, fontweight='bold')
     ax1.set_ylabel('Price ($)', fontsize=12)
@@ -360,16 +467,15 @@ def plot_price_and_volume(
     ax1.legend()
 
     # Plot volume
-    colors = ['green' if df['Close'].iloc[i] >= df['Open'].iloc[i] else 'red'
-              for i in range(len(df))]
-    ax2.bar(df.index, df['Volume'], color=colors, alpha=0.6)
+    colors = np.where(df['Close'].to_numpy() >= df['Open'].to_numpy(), 'green', 'red')
+    ax2.bar(df.index, df['Volume'], color=colors, alpha=0.6, rasterized=rasterized)
     ax2.set_ylabel('Volume', fontsize=12)
     ax2.set_xlabel('Date', fontsize=12)
     ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1e6:.1f}M'))
 
     # Format x-axis
     ax2.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.xticks(rotation=45)
+    ax2.tick_params(axis='x', labelrotation=45)
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig